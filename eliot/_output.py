@@ -6,6 +6,7 @@ import traceback
 import inspect
 from threading import Lock
 from functools import wraps
+from collections import deque
 from io import IOBase
 import warnings
 
@@ -20,7 +21,8 @@ from .json import (
     json_default,
     _encoder_to_default_function,
     _dumps_bytes,
-    _dumps_unicode,
+    _dumps_bytes_line,
+    _dumps_unicode_line,
 )
 from ._validation import ValidationError
 
@@ -32,16 +34,17 @@ DESTINATION_FAILURE = "eliot:destination_failure"
 
 class BufferingDestination(object):
     """
-    Buffer messages in memory.
+    Buffer the most recent 1000 messages in memory.
     """
 
+    __slots__ = ("messages",)
+
     def __init__(self):
-        self.messages = []
+        # Older messages get discarded automatically:
+        self.messages = deque(maxlen=1000)
 
     def __call__(self, message):
         self.messages.append(message)
-        while len(self.messages) > 1000:
-            self.messages.pop(0)
 
 
 class Destinations(object):
@@ -52,6 +55,8 @@ class Destinations(object):
     send written messages.
     """
 
+    __slots__ = ("_destinations", "_any_added", "_globalFields")
+
     def __init__(self):
         self._destinations = [BufferingDestination()]
         self._any_added = False
@@ -79,7 +84,9 @@ class Destinations(object):
 
         @param logger: The ``ILogger`` that wrote the message, if any.
         """
-        message.update(self._globalFields)
+        global_fields = self._globalFields
+        if global_fields:
+            message.update(global_fields)
         errors = []
         is_destination_error_message = (
             message.get("message_type", None) == DESTINATION_FAILURE
@@ -93,11 +100,86 @@ class Destinations(object):
                 # "eliot:destination_failure" log message logged, and so we
                 # want to ensure it doesn't do infinite recursion.
                 if not is_destination_error_message:
-                    errors.append(e)
+                    # We only need the exception's type and value; dropping
+                    # the traceback avoids a reference cycle through this
+                    # frame that would otherwise need the GC to clean up:
+                    errors.append(e.with_traceback(None))
+
+        if errors:
+            self._log_destination_failures(errors, message, logger)
+
+    def send_many(self, messages, logger=None):
+        """
+        Deliver a batch of messages to all destinations.
+
+        Destinations with a C{write_batch} method are given the whole batch
+        in a single call, other destinations are called once per message.
+        C{write_batch} may return an iterable of C{(message, exception)} pairs
+        for messages it skipped, e.g. because they couldn't be encoded; if it
+        raises an exception, the whole batch is considered to have failed.
+        Either way messages are never resent, so nothing is written twice.
+        Failures are logged after the whole batch has been delivered.
+
+        The passed in messages might be mutated.
+
+        This should never raise an exception.
 
-        for exception in errors:
-            from ._action import log_message
+        @param messages: A C{list} of message dictionaries that can be
+            serialized to JSON.
 
+        @param logger: The ``ILogger`` that wrote the messages, if any.
+        """
+        global_fields = self._globalFields
+        if global_fields:
+            for message in messages:
+                message.update(global_fields)
+        # Map id() of each failed message to (message, exceptions):
+        errors = {}
+        for dest in self._destinations:
+            write_batch = getattr(dest, "write_batch", None)
+            if write_batch is not None:
+                try:
+                    failures = write_batch(messages)
+                except Exception as e:
+                    e = e.with_traceback(None)
+                    failures = [(message, e) for message in messages]
+                for message, exception in failures or ():
+                    errors.setdefault(id(message), (message, []))[1].append(exception)
+                continue
+            for message in messages:
+                try:
+                    dest(message)
+                except Exception as e:
+                    errors.setdefault(id(message), (message, []))[1].append(
+                        e.with_traceback(None)
+                    )
+
+        for message, exceptions in errors.values():
+            # As in send(), avoid infinite recursion on continously broken
+            # destinations:
+            if message.get("message_type", None) != DESTINATION_FAILURE:
+                self._log_destination_failures(exceptions, message, logger)
+
+    def _log_destination_failures(self, exceptions, message, logger):
+        """
+        Log a C{eliot:destination_failure} message for each exception raised
+        by destinations when given the same message.
+
+        @param exceptions: A C{list} of L{Exception} raised by destinations.
+
+        @param message: The message dictionary the destinations failed on.
+
+        @param logger: The ``ILogger`` that wrote the message, if any.
+        """
+        from ._action import log_message
+
+        try:
+            # Only do the expensive conversion of the message once, no
+            # matter how many destinations failed on it:
+            safe_message = _safe_unicode_dictionary_as_dict(message)
+        except:
+            return
+        for exception in exceptions:
             try:
                 new_msg = {
                     MESSAGE_TYPE_FIELD: DESTINATION_FAILURE,
@@ -105,7 +187,7 @@ class Destinations(object):
                     EXCEPTION_FIELD: exception.__class__.__module__
                     + "."
                     + exception.__class__.__name__,
-                    "message": _safe_unicode_dictionary(message),
+                    "message": safe_message,
                 }
                 if logger is not None:
                     # This is really only useful for testing, should really
@@ -172,6 +254,37 @@ class ILogger(Interface):
         @type dictionary: C{dict}
         """
 
+    def write_many(dictionaries, serializer=None):
+        """
+        Write multiple dictionaries to the appropriate destination, as if
+        C{write} was called for each of them.
+
+        @note: This method is thread-safe.
+
+        @param dictionaries: An iterable of messages to write out. They will
+            not be mutated.
+
+        @param serializer: Either C{None}, or a
+            L{eliot._validation._MessageSerializer} which can be used to
+            validate all the messages.
+        """
+
+
+def _safe_unicode_dictionary_as_dict(dictionary):
+    """
+    Convert a dictionary's keys and values to unicode strings no matter what
+    it contains.
+
+    Unlike L{_safe_unicode_dictionary} the result is a dictionary, so it can
+    be logged as-is without first rendering it to a string.
+
+    @param dictionary: A L{dict} to convert.
+
+    @return: A L{dict} mapping the C{repr()} of each key to the C{repr()} of
+        its value, as L{str}.
+    """
+    return {saferepr(key): saferepr(value) for (key, value) in dictionary.items()}
+
 
 def _safe_unicode_dictionary(dictionary):
     """
@@ -180,17 +293,16 @@ def _safe_unicode_dictionary(dictionary):
     The resulting dictionary will loosely follow Python syntax but it is
     not expected to actually be a lossless encoding in all cases.
 
+    No longer used by Eliot itself, which logs the result of
+    L{_safe_unicode_dictionary_as_dict} instead.
+
     @param dictionary: A L{dict} to serialize.
 
     @return: A L{str} string representing the input dictionary as
         faithfully as can be done without putting in too much effort.
     """
     try:
-        return str(
-            dict(
-                (saferepr(key), saferepr(value)) for (key, value) in dictionary.items()
-            )
-        )
+        return str(_safe_unicode_dictionary_as_dict(dictionary))
     except:
         return saferepr(dictionary)
 
@@ -207,6 +319,22 @@ class Logger(object):
 
     _destinations = Destinations()
 
+    def _log_serialization_failure(self, dictionary):
+        """
+        Log the exception currently being handled, along with the dictionary
+        that failed to serialize.
+
+        @param dictionary: The (partially serialized) message dictionary.
+        """
+        write_traceback(self)
+        from ._action import log_message
+
+        log_message(
+            "eliot:serialization_failure",
+            message=_safe_unicode_dictionary_as_dict(dictionary),
+            __eliot_logger__=self,
+        )
+
     def write(self, dictionary, serializer=None):
         """
         Serialize the dictionary, and write it to C{self._destinations}.
@@ -216,18 +344,43 @@ class Logger(object):
             if serializer is not None:
                 serializer.serialize(dictionary)
         except:
-            write_traceback(self)
-            from ._action import log_message
-
-            log_message(
-                "eliot:serialization_failure",
-                message=_safe_unicode_dictionary(dictionary),
-                __eliot_logger__=self,
-            )
+            self._log_serialization_failure(dictionary)
             return
 
         self._destinations.send(dictionary, self)
 
+    def write_many(self, dictionaries, serializer=None):
+        """
+        Serialize the dictionaries, and write them to C{self._destinations}
+        as a single batch.
+
+        This is cheaper than calling L{Logger.write} for each message when
+        logging many messages in a tight loop.
+
+        @param dictionaries: An iterable of message dictionaries. They will
+            not be mutated.
+
+        @param serializer: Either C{None}, or a
+            L{eliot._validation._MessageSerializer} used for all the messages.
+        """
+        batch = []
+        for dictionary in dictionaries:
+            dictionary = dictionary.copy()
+            try:
+                if serializer is not None:
+                    serializer.serialize(dictionary)
+            except:
+                # Send the messages before this one first, so the failure is
+                # logged in the same order as the input:
+                if batch:
+                    self._destinations.send_many(batch, self)
+                    batch = []
+                self._log_serialization_failure(dictionary)
+                continue
+            batch.append(dictionary)
+        if batch:
+            self._destinations.send_many(batch, self)
+
 
 def exclusively(f):
     """
@@ -291,6 +444,18 @@ class MemoryLogger(object):
 
         @return: C{list} of flushed messages.
         """
+        matching = {
+            typ for typ in self._traceback_types if issubclass(typ, exceptionType)
+        }
+        if not matching:
+            return []
+        self._traceback_types -= matching
+        if not self._traceback_types:
+            # Everything matched, no need to filter:
+            result = self.tracebackMessages
+            self.tracebackMessages = []
+            return result
+
         result = []
         remaining = []
         for message in self.tracebackMessages:
@@ -328,6 +493,20 @@ class MemoryLogger(object):
         self.serializers.append(serializer)
         if serializer is TRACEBACK_MESSAGE._serializer:
             self.tracebackMessages.append(dictionary)
+            self._traceback_types.add(type(dictionary[REASON_FIELD]))
+
+    def write_many(self, dictionaries, serializer=None):
+        """
+        Add multiple dictionaries to the messages, as L{MemoryLogger.write}
+        does for each one.
+
+        @param dictionaries: An iterable of message dictionaries.
+
+        @param serializer: Either C{None}, or a
+            L{eliot._validation._MessageSerializer} used for all the messages.
+        """
+        for dictionary in dictionaries:
+            self.write(dictionary, serializer)
 
     def _validate_message(self, dictionary, serializer):
         """Validate an individual message.
@@ -349,15 +528,13 @@ class MemoryLogger(object):
             serializer.validate(dictionary)
         for key in dictionary:
             if not isinstance(key, str):
-                if isinstance(key, bytes):
-                    key.decode("utf-8")
-                else:
-                    raise TypeError(dictionary, "%r is not unicode" % (key,))
+                raise TypeError(dictionary, "%r is not unicode" % (key,))
         if serializer is not None:
             serializer.serialize(dictionary)
 
+        # We only care whether encoding succeeds, so skip decoding the result:
         try:
-            _dumps_unicode(dictionary, default=self._json_default)
+            _dumps_bytes(dictionary, default=self._json_default)
         except Exception as e:
             raise TypeError("Message %s doesn't encode to JSON: %s" % (dictionary, e))
 
@@ -417,6 +594,8 @@ class MemoryLogger(object):
         self.messages = []
         self.serializers = []
         self.tracebackMessages = []
+        # Exception types of the messages in tracebackMessages:
+        self._traceback_types = set()
         self._failed_validations = []
 
 
@@ -443,15 +622,23 @@ class FileDestination(PClass):
 
     @ivar file: The file to which messages will be written.
 
-    @ivar _dumps: Function that serializes an object to JSON.
+    @ivar _dumps: Function that serializes an object to a line of JSON,
+        including the trailing newline.
+
+    @ivar _join: C{join} method of an empty C{bytes} or C{str}, matching
+        the type written to the file.
+
+    @ivar _file_write: The file's C{write} method.
 
-    @ivar _linebreak: C{"\n"} as either bytes or unicode.
+    @ivar _file_flush: The file's C{flush} method.
     """
 
     file = field(mandatory=True)
     _json_default = field(mandatory=True)
     _dumps = field(mandatory=True)
-    _linebreak = field(mandatory=True)
+    _join = field(mandatory=True)
+    _file_write = field(mandatory=True)
+    _file_flush = field(mandatory=True)
 
     def __new__(cls, file, encoder=None, json_default=json_default):
         """
@@ -473,16 +660,21 @@ class FileDestination(PClass):
             unicodeFile = True
 
         if unicodeFile:
-            _dumps = _dumps_unicode
-            _linebreak = "\n"
+            _dumps = _dumps_unicode_line
+            _join = "".join
         else:
-            _dumps = _dumps_bytes
-            _linebreak = b"\n"
+            _dumps = _dumps_bytes_line
+            _join = b"".join
         return PClass.__new__(
             cls,
             file=file,
             _dumps=_dumps,
-            _linebreak=_linebreak,
+            _join=_join,
+            # Bound once, rather than looked up on every message. Bound
+            # methods of the same file compare equal, so equal destinations
+            # can still be found by Destinations.remove():
+            _file_write=file.write,
+            _file_flush=file.flush,
             _json_default=json_default,
         )
 
@@ -490,10 +682,34 @@ class FileDestination(PClass):
         """
         @param message: A message dictionary.
         """
-        self.file.write(
-            self._dumps(message, default=self._json_default) + self._linebreak
-        )
-        self.file.flush()
+        self._file_write(self._dumps(message, default=self._json_default))
+        self._file_flush()
+
+    def write_batch(self, messages):
+        """
+        Write multiple messages with a single C{write()} and C{flush()}.
+
+        Messages that can't be encoded are skipped, and the rest are still
+        written.
+
+        @param messages: A C{list} of message dictionaries.
+
+        @return: A C{list} of C{(message, exception)} pairs for the messages
+            that couldn't be encoded.
+        """
+        dumps = self._dumps
+        json_default = self._json_default
+        lines = []
+        failures = []
+        for message in messages:
+            try:
+                lines.append(dumps(message, default=json_default))
+            except Exception as e:
+                failures.append((message, e.with_traceback(None)))
+        if lines:
+            self._file_write(self._join(lines))
+            self._file_flush()
+        return failures
 
 
 def to_file(output_file, encoder=None, json_default=json_default):
@@ -228,6 +228,23 @@ class _MessageSerializer(object):
                 )
         self.fields = dict((field.key, field) for field in fields)
         self.allow_additional_fields = allow_additional_fields
+        # Serialization happens for every logged message, so look up each
+        # field's serialization function once, skipping the method call
+        # indirection of Field.serialize() unless a subclass overrides it:
+        self._serializers = tuple(
+            (
+                key,
+                (
+                    field._serializer
+                    if type(field).serialize is Field.serialize
+                    else field.serialize
+                ),
+            )
+            for (key, field) in self.fields.items()
+        )
+        # Keys allowed in messages, precomputed so validation doesn't need to
+        # rebuild the set for every message:
+        self._allowed_keys = frozenset(self.fields) | frozenset(RESERVED_FIELDS)
 
     def serialize(self, message):
         """
@@ -241,8 +258,8 @@ class _MessageSerializer(object):
 
         @param message: A C{dict}.
         """
-        for key, field in self.fields.items():
-            message[key] = field.serialize(message[key])
+        for key, serializer in self._serializers:
+            message[key] = serializer(message[key])
 
     def validate(self, message):
         """
@@ -260,10 +277,12 @@ class _MessageSerializer(object):
 
         if self.allow_additional_fields:
             return
-        # Otherwise, additional fields are not allowed:
-        fieldSet = set(self.fields) | set(RESERVED_FIELDS)
+        # Otherwise, additional fields are not allowed. The common case is a
+        # valid message, so check that first with a single subset test:
+        if message.keys() <= self._allowed_keys:
+            return
         for key in message:
-            if key not in fieldSet:
+            if key not in self._allowed_keys:
                 raise ValidationError(message, "Unexpected field %r" % (key,))
 
 
@@ -9,7 +9,9 @@ if __name__ == "__main__":
 
 import sys
 from datetime import datetime, timedelta
-from json import JSONEncoder, dumps, loads
+from json import JSONEncoder, dumps
+
+from .json import _loads as loads
 
 
 class _DatetimeJSONEncoder(JSONEncoder):
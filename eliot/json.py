@@ -55,18 +55,64 @@ def _encoder_to_default_function(
     return default
 
 
+def _stdlib_dumps_unicode(o: object, default=None) -> str:
+    """Serialize an object to JSON with the standard library, output str."""
+    try:
+        # Objects made up only of JSON-native types can use the standard
+        # library's shared encoder; passing ``default`` would construct a new
+        # encoder on every call:
+        return json.dumps(o)
+    except TypeError:
+        return json.dumps(o, default=default)
+
+
+def _stdlib_dumps_bytes(o: object, default=None) -> bytes:
+    """Serialize an object to JSON with the standard library, output bytes."""
+    return _stdlib_dumps_unicode(o, default=default).encode("utf-8")
+
+
+# Parse JSON from bytes or str. This is deliberately the standard library
+# even when orjson is available: orjson silently turns integers too big for
+# 64 bits into floats, losing data, and rejects NaN and Infinity.
+_loads = json.loads
+
+
 try:
     from orjson import dumps as _dumps_bytes
 
     def _dumps_unicode(o: object, default=None) -> str:
         return _dumps_bytes(o, default=default).decode("utf-8")
 
+    try:
+        from orjson import OPT_APPEND_NEWLINE
+    except ImportError:
+        # Older orjson releases don't have this option.
+        def _dumps_bytes_line(o: object, default=None) -> bytes:
+            """Serialize an object to a line of JSON, output bytes."""
+            return _dumps_bytes(o, default=default) + b"\n"
+
+    else:
+
+        def _dumps_bytes_line(o: object, default=None) -> bytes:
+            """Serialize an object to a line of JSON, output bytes."""
+            # Having orjson add the newline avoids copying the output again:
+            return _dumps_bytes(o, default=default, option=OPT_APPEND_NEWLINE)
+
+    def _dumps_unicode_line(o: object, default=None) -> str:
+        """Serialize an object to a line of JSON, output str."""
+        return _dumps_bytes_line(o, default=default).decode("utf-8")
+
 except ImportError:
+    _dumps_bytes = _stdlib_dumps_bytes
+    _dumps_unicode = _stdlib_dumps_unicode
+
+    def _dumps_bytes_line(o: object, default=None) -> bytes:
+        """Serialize an object to a line of JSON, output bytes."""
+        return _stdlib_dumps_bytes(o, default=default) + b"\n"
 
-    def _dumps_bytes(o: object, default=None) -> bytes:
-        """Serialize an object to JSON, output bytes."""
-        return json.dumps(o, default=default).encode("utf-8")
+    def _dumps_unicode_line(o: object, default=None) -> str:
+        """Serialize an object to a line of JSON, output str."""
+        return _stdlib_dumps_unicode(o, default=default) + "\n"
 
-    _dumps_unicode = json.dumps
 
 __all__ = ["EliotJSONEncoder", "json_default"]
@@ -5,7 +5,7 @@ Runs in a thread, so that we don't do blocking I/O in the event loop thread.
 """
 
 import threading
-from queue import SimpleQueue
+from queue import SimpleQueue, Empty
 
 from twisted.application.service import Service
 from twisted.internet.threads import deferToThreadPool
@@ -14,6 +14,10 @@ from . import addDestination, removeDestination
 
 _STOP = object()
 
+# The most messages written to the wrapped destination in one batch, so a
+# large backlog is written in chunks rather than as one huge write:
+_MAX_BATCH = 1024
+
 
 class ThreadedWriter(Service):
     """
@@ -71,11 +75,46 @@ class ThreadedWriter(Service):
         """
         Runs in a thread, reads messages from a queue and writes them to
         the wrapped observer.
+
+        Messages that queued up while the previous ones were being written are
+        written together, up to C{_MAX_BATCH} at a time, with a single call to
+        the wrapped destination's C{write_batch} method if it has one.
         """
         while True:
             msg = self._queue.get()
+            messages = []
+            while msg is not _STOP:
+                messages.append(msg)
+                if len(messages) >= _MAX_BATCH:
+                    break
+                try:
+                    msg = self._queue.get_nowait()
+                except Empty:
+                    break
+            if messages:
+                self._write(messages)
             if msg is _STOP:
                 return
+
+    def _write(self, messages):
+        """
+        Write messages to the wrapped destination.
+
+        @param messages: A C{list} of messages.
+        """
+        write_batch = getattr(self._destination, "write_batch", None)
+        if write_batch is not None:
+            try:
+                # Messages the destination couldn't encode are skipped by
+                # write_batch itself, so the batch is never resent: it may
+                # already have been partially written.
+                write_batch(messages)
+            except Exception:
+                # Lower-level destination blew up, nothing we can do, so
+                # just drop on the floor.
+                pass
+            return
+        for msg in messages:
             try:
                 self._destination(msg)
             except Exception:
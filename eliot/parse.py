@@ -37,6 +37,61 @@ class Task(PClass):
         """
         return self._root_level in self._completed
 
+    def add(self, message_dict):
+        """
+        Update the L{Task} with a dictionary containing a serialized Eliot
+        message.
+
+        @param message_dict: Dictionary whose task UUID matches this one.
+
+        @return: Updated L{Task}.
+        """
+        return self.add_many([message_dict])
+
+    def add_many(self, message_dicts):
+        """
+        Update the L{Task} with multiple dictionaries containing serialized
+        Eliot messages.
+
+        This is equivalent to calling L{Task.add} for each message, but
+        faster, since the intermediate L{Task} instances are never created.
+
+        @param message_dicts: Iterable of dictionaries whose task UUIDs match
+            this one.
+
+        @return: Updated L{Task}.
+        """
+        builder = _TaskBuilder(self)
+        for message_dict in message_dicts:
+            builder.add(message_dict)
+        return builder.task()
+
+
+class _TaskBuilder(object):
+    """
+    Mutable version of a L{Task}, used to add messages without creating a new
+    L{Task} for each one.
+
+    @ivar _nodes: An evolver for L{Task._nodes}.
+
+    @ivar _completed: The L{Task._completed} set. Actions complete rarely
+        compared to how often messages are added, so this is updated as a
+        persistent set.
+    """
+
+    def __init__(self, task):
+        self._task = task
+        self._nodes = task._nodes.evolver()
+        self._completed = task._completed
+
+    def task(self):
+        """
+        @return: The updated L{Task}.
+        """
+        return self._task.set(
+            _nodes=self._nodes.persistent(), _completed=self._completed
+        )
+
     def _insert_action(self, node):
         """
         Add a L{WrittenAction} to the tree.
@@ -44,19 +99,17 @@ class Task(PClass):
         Parent actions will be created as necessary.
 
         @param child: A L{WrittenAction} to add to the tree.
-
-        @return: Updated L{Task}.
         """
-        task = self
         if (
             node.end_message
             and node.start_message
-            and (len(node.children) == node.end_message.task_level.level[-1] - 2)
+            # _children, rather than children, avoids sorting them:
+            and (len(node._children) == node.end_message.task_level.level[-1] - 2)
         ):
             # Possibly this action is complete, make sure all sub-actions
             # are complete:
             completed = True
-            for child in node.children:
+            for child in node._children.values():
                 if (
                     isinstance(child, WrittenAction)
                     and child.task_level not in self._completed
@@ -64,9 +117,9 @@ class Task(PClass):
                     completed = False
                     break
             if completed:
-                task = task.transform(["_completed"], lambda s: s.add(node.task_level))
-        task = task.transform(["_nodes", node.task_level], node)
-        return task._ensure_node_parents(node)
+                self._completed = self._completed.add(node.task_level)
+        self._nodes[node.task_level] = node
+        self._ensure_node_parents(node)
 
     def _ensure_node_parents(self, child):
         """
@@ -77,36 +130,32 @@ class Task(PClass):
 
         @param child: A L{WrittenMessage} or L{WrittenAction} which is
             being added to the tree.
-
-        @return: Updated L{Task}.
         """
         task_level = child.task_level
-        if task_level.parent() is None:
-            return self
-
-        parent = self._nodes.get(task_level.parent())
-        if parent is None:
-            parent = WrittenAction(
-                task_level=task_level.parent(), task_uuid=child.task_uuid
-            )
+        parent_level = task_level.parent()
+        if parent_level is None:
+            return
+
+        if parent_level in self._nodes:
+            parent = self._nodes[parent_level]
+        else:
+            parent = WrittenAction(task_level=parent_level, task_uuid=child.task_uuid)
         parent = parent._add_child(child)
-        return self._insert_action(parent)
+        self._insert_action(parent)
 
     def add(self, message_dict):
         """
-        Update the L{Task} with a dictionary containing a serialized Eliot
-        message.
+        Add a dictionary containing a serialized Eliot message.
 
-        @param message_dict: Dictionary whose task UUID matches this one.
-
-        @return: Updated L{Task}.
+        @param message_dict: Dictionary whose task UUID matches the task's.
         """
         is_action = message_dict.get(ACTION_TYPE_FIELD) is not None
         written_message = WrittenMessage.from_dict(message_dict)
         if is_action:
             action_level = written_message.task_level.parent()
-            action = self._nodes.get(action_level)
-            if action is None:
+            if action_level in self._nodes:
+                action = self._nodes[action_level]
+            else:
                 action = WrittenAction(
                     task_level=action_level, task_uuid=message_dict[TASK_UUID_FIELD]
                 )
@@ -116,18 +165,15 @@ class Task(PClass):
                 action = action._start(written_message)
             else:
                 action = action._end(written_message)
-            return self._insert_action(action)
+            self._insert_action(action)
         else:
             # Special case where there is no action:
             if written_message.task_level.level == [1]:
-                return self.transform(
-                    ["_nodes", self._root_level],
-                    written_message,
-                    ["_completed"],
-                    lambda s: s.add(self._root_level),
-                )
+                root_level = Task._root_level
+                self._nodes[root_level] = written_message
+                self._completed = self._completed.add(root_level)
             else:
-                return self._ensure_node_parents(written_message)
+                self._ensure_node_parents(written_message)
 
 
 class Parser(PClass):
@@ -5,12 +5,12 @@ API and command-line support for human-readable Eliot messages.
 import pprint
 import argparse
 from datetime import datetime
+from functools import lru_cache
+from math import modf
 from sys import stdin, stdout
 from collections import OrderedDict
 from json import dumps
 
-from json import loads
-
 from ._message import (
     TIMESTAMP_FIELD,
     TASK_UUID_FIELD,
@@ -18,7 +18,7 @@ from ._message import (
     MESSAGE_TYPE_FIELD,
 )
 from ._action import ACTION_TYPE_FIELD, ACTION_STATUS_FIELD
-
+from .json import _loads as loads
 
 # Ensure binary stdin, since we expect specifically UTF-8 encoded
 # messages, not platform-encoding messages.
@@ -42,16 +42,35 @@ _skip_fields = {
 _first_fields = [ACTION_TYPE_FIELD, MESSAGE_TYPE_FIELD, ACTION_STATUS_FIELD]
 
 
-def _render_timestamp(message: dict, local_timezone: bool) -> str:
-    """Convert a message's timestamp to a string."""
+@lru_cache(maxsize=4096)
+def _render_second(seconds: int, local_timezone: bool) -> str:
+    """Convert a whole number of seconds since the epoch to a string."""
     # If we were returning or storing the datetime we'd want to use an
     # explicit timezone instead of a naive datetime, but since we're
     # just using it for formatting we needn't bother.
     if local_timezone:
-        dt = datetime.fromtimestamp(message[TIMESTAMP_FIELD])
+        dt = datetime.fromtimestamp(seconds)
     else:
-        dt = datetime.utcfromtimestamp(message[TIMESTAMP_FIELD])
-    result = dt.isoformat(sep="T")
+        dt = datetime.utcfromtimestamp(seconds)
+    return dt.isoformat(sep="T")
+
+
+def _render_timestamp(message: dict, local_timezone: bool) -> str:
+    """Convert a message's timestamp to a string."""
+    # Messages in a log tend to share the same second, so only the
+    # microseconds are formatted for each one. They are rounded the same way
+    # datetime.fromtimestamp() does, so the result matches isoformat():
+    fraction, seconds = modf(message[TIMESTAMP_FIELD])
+    microseconds = round(fraction * 1e6)
+    if microseconds >= 1000000:
+        seconds += 1
+        microseconds -= 1000000
+    elif microseconds < 0:
+        seconds -= 1
+        microseconds += 1000000
+    result = _render_second(int(seconds), local_timezone)
+    if microseconds:
+        result += ".%06d" % (microseconds,)
     if not local_timezone:
         result += "Z"
     return result
@@ -128,10 +147,16 @@ Reads JSON lines from stdin, write out pretty-printed results on stdout.
 """
 
 
-def _main():
+def _main(argv=None, stdin=stdin, stdout=stdout):
     """
     Command-line program that reads in JSON from stdin and writes out
     pretty-printed messages to stdout.
+
+    @param argv: Command-line arguments, or C{None} to use C{sys.argv}.
+
+    @param stdin: Binary file to read JSON lines from.
+
+    @param stdout: Text file to write formatted messages to.
     """
     parser = argparse.ArgumentParser(
         description=_CLI_HELP, usage="cat messages | %(prog)s [options]"
@@ -151,7 +176,7 @@ def _main():
         help="Use local timezone instead of UTC.",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if args.compact:
         formatter = compact_format
     else:
@@ -3,6 +3,7 @@ Hypothesis strategies for eliot.
 """
 
 from functools import partial
+from itertools import product
 
 from hypothesis.strategies import (
     builds,
@@ -15,7 +16,7 @@ from hypothesis.strategies import (
     none,
     one_of,
     recursive,
-    text,
+    sampled_from,
     uuids,
 )
 
@@ -44,11 +45,14 @@ task_level_indexes = integers(min_value=1, max_value=10)
 task_level_lists = lists(task_level_indexes, min_size=1, max_size=6)
 task_levels = task_level_lists.map(lambda level: TaskLevel(level=level))
 
-# Text generation is slow, and most of the things are short labels. We set
-# a restricted alphabet so they're easier to read, and in general large
-# amount of randomness in label generation doesn't enhance our testing in
-# any way, since we don't parse type names or user field values.
-labels = text(min_size=1, max_size=8, alphabet="CGAT")
+# Text generation is slow, and most of the things are short labels. We pick
+# from a fixed pool using a restricted alphabet so they're easier to read, and
+# in general large amount of randomness in label generation doesn't enhance
+# our testing in any way, since we don't parse type names or user field
+# values.
+labels = sampled_from(
+    ["".join(chars) for length in (1, 2, 3) for chars in product("CGAT", repeat=length)]
+)
 
 timestamps = floats(min_value=0, max_value=1000.0)
 
@@ -78,8 +82,10 @@ def written_from_pmap(d):
     return WrittenMessage.from_dict(thaw(d))
 
 
-def union(*dicts):
-    result = pmap().evolver()
+def union(first, *dicts):
+    # Start from the first mapping, so only the keys of the rest need to be
+    # inserted:
+    result = pmap(first).evolver()
     for d in dicts:
         # Work around bug in pyrsistent where it sometimes loses updates if
         # they contain some kv pairs that are identical to the ones in the
@@ -173,6 +179,9 @@ written_actions = recursive(
         child_messages=lists(children, max_size=5),
         end_message_dict=builds(union, message_dicts, _end_action_fields) | none(),
     ),
+    # Bigger trees are slow to generate and reparent, and don't find more
+    # bugs:
+    max_leaves=20,
 )
 
 
@@ -38,6 +38,15 @@ class EliotFilterTests(TestCase):
             + "\n",
         )
 
+    def test_big_integer(self):
+        """
+        Integers too big for 64 bits are decoded and written out exactly.
+        """
+        f = StringIO()
+        efilter = EliotFilter("J", [b'{"id": 123456789012345678901234567890}'], f)
+        efilter.run()
+        self.assertEqual(f.getvalue(), '{"id": 123456789012345678901234567890}\n')
+
     def evaluateExpression(self, expr, message):
         """
         Render a single message with the given expression using
@@ -4,6 +4,7 @@ Tests for L{eliot.json}.
 
 from unittest import TestCase, skipUnless, skipIf
 from json import loads
+from math import isnan
 
 try:
     import numpy as np
@@ -15,6 +16,11 @@ from eliot.json import (
     json_default,
     _encoder_to_default_function,
     _dumps_unicode as dumps,
+    _dumps_bytes_line,
+    _dumps_unicode_line,
+    _loads,
+    _stdlib_dumps_bytes,
+    _stdlib_dumps_unicode,
 )
 
 
@@ -83,3 +89,108 @@ class EliotJSONEncoderTests(TestCase):
             loads(dumps(a1002, default=json_default)),
             {"array_start": a1002.flat[:10000].tolist(), "original_shape": [2, 5001]},
         )
+
+
+class StdlibDumpsTests(TestCase):
+    """
+    Tests for the standard library JSON serialization used when C{orjson} is
+    unavailable.
+    """
+
+    def test_native_types(self):
+        """
+        Objects made up of JSON-native types are serialized without needing the
+        default function.
+        """
+
+        def default(o):
+            raise AssertionError("default() should not be called")
+
+        message = {"x": 123, "y": None, "z": ["abc", 1.5, True, {"a": "\u1234"}]}
+        self.assertEqual(
+            loads(_stdlib_dumps_unicode(message, default=default)), message
+        )
+        self.assertEqual(loads(_stdlib_dumps_bytes(message, default=default)), message)
+
+    def test_default(self):
+        """
+        Objects that aren't JSON-native are serialized with the default
+        function.
+        """
+        custom = object()
+
+        def default(o):
+            if o is custom:
+                return "CUSTOM!"
+            raise TypeError
+
+        message = {"x": 123, "z": custom}
+        expected = {"x": 123, "z": "CUSTOM!"}
+        self.assertEqual(
+            loads(_stdlib_dumps_unicode(message, default=default)), expected
+        )
+        self.assertEqual(loads(_stdlib_dumps_bytes(message, default=default)), expected)
+
+    def test_unsupported(self):
+        """
+        If neither the standard library nor the default function can serialize
+        an object, a C{TypeError} is raised.
+        """
+        with self.assertRaises(TypeError):
+            _stdlib_dumps_unicode([object()], default=json_default)
+
+
+class DumpsLineTests(TestCase):
+    """Tests for L{eliot.json._dumps_bytes_line} and L{_dumps_unicode_line}."""
+
+    def test_line(self):
+        """
+        The object is serialized to JSON on a single line, ending with a
+        newline, using the given default function.
+        """
+        custom = object()
+
+        def default(o):
+            if o is custom:
+                return "CUSTOM!"
+            raise TypeError
+
+        message = {"x": "a\nb", "y": [1, 2], "z": custom}
+        bytes_line = _dumps_bytes_line(message, default=default)
+        unicode_line = _dumps_unicode_line(message, default=default)
+        self.assertEqual(bytes_line.count(b"\n"), 1)
+        self.assertTrue(bytes_line.endswith(b"\n"))
+        self.assertEqual(loads(bytes_line), {"x": "a\nb", "y": [1, 2], "z": "CUSTOM!"})
+        self.assertEqual(unicode_line, bytes_line.decode("utf-8"))
+
+
+class LoadsTests(TestCase):
+    """Tests for L{eliot.json._loads}."""
+
+    def test_bytes_and_str(self):
+        """L{_loads} parses JSON given as either C{bytes} or C{str}."""
+        self.assertEqual(_loads(b'{"a": [1, "\\u1234"]}'), {"a": [1, "\u1234"]})
+        self.assertEqual(_loads('{"a": [1, "\\u1234"]}'), {"a": [1, "\u1234"]})
+
+    def test_nan(self):
+        """
+        L{_loads} parses NaN and infinity, as emitted by the standard library
+        JSON encoder.
+        """
+        result = _loads(b'{"a": NaN, "b": Infinity}')
+        self.assertTrue(isnan(result["a"]))
+        self.assertEqual(result["b"], float("inf"))
+
+    def test_big_integer(self):
+        """
+        L{_loads} parses integers too big for 64 bits exactly, rather than
+        converting them to floats.
+        """
+        result = _loads(b'{"id": 123456789012345678901234567890}')
+        self.assertEqual(result["id"], 123456789012345678901234567890)
+        self.assertIsInstance(result["id"], int)
+
+    def test_invalid(self):
+        """L{_loads} raises a C{ValueError} on invalid JSON."""
+        with self.assertRaises(ValueError):
+            _loads(b"NOT JSON!!")
@@ -260,3 +260,103 @@ class ThreadedWriterTests(TestCase):
         d = writer.stopService()
         d.addCallback(lambda _: self.assertEqual(result, [(msg, thread_ident)]))
         return d
+
+    def test_batch(self):
+        """
+        Messages that queue up while the underlying destination is busy are
+        passed together to its C{write_batch} method, if it has one.
+        """
+        batches = []
+        writing = threading.Event()
+        proceed = threading.Event()
+
+        class Destination(object):
+            def __call__(self, message):
+                self.write_batch([message])
+
+            def write_batch(self, messages):
+                batches.append(list(messages))
+                if len(batches) == 1:
+                    writing.set()
+                    proceed.wait(5)
+
+        writer = ThreadedWriter(Destination(), reactor)
+        writer.startService()
+        writer({"a": 1})
+        writing.wait(5)
+        writer({"b": 2})
+        writer({"c": 3})
+        proceed.set()
+        d = writer.stopService()
+        d.addCallback(
+            lambda _: self.assertEqual(batches, [[{"a": 1}], [{"b": 2}, {"c": 3}]])
+        )
+        return d
+
+    def test_batch_size_limit(self):
+        """
+        No more than C{_MAX_BATCH} queued messages are passed to
+        C{write_batch} at once.
+        """
+        from .. import logwriter
+
+        self.patch(logwriter, "_MAX_BATCH", 2)
+        batches = []
+        writing = threading.Event()
+        proceed = threading.Event()
+
+        class Destination(object):
+            def __call__(self, message):
+                self.write_batch([message])
+
+            def write_batch(self, messages):
+                batches.append(list(messages))
+                if len(batches) == 1:
+                    writing.set()
+                    proceed.wait(5)
+
+        writer = ThreadedWriter(Destination(), reactor)
+        writer.startService()
+        writer({"a": 1})
+        writing.wait(5)
+        writer({"b": 2})
+        writer({"c": 3})
+        writer({"d": 4})
+        proceed.set()
+        d = writer.stopService()
+        d.addCallback(
+            lambda _: self.assertEqual(
+                batches, [[{"a": 1}], [{"b": 2}, {"c": 3}], [{"d": 4}]]
+            )
+        )
+        return d
+
+    def test_batch_bad_message(self):
+        """
+        If a message in a batch can't be encoded by a L{FileDestination}, the
+        other messages are still written.
+        """
+        f = BytesIO()
+        writer = ThreadedWriter(FileDestination(file=f), reactor)
+        writer._write([{"a": 1}, {"b": object()}, {"c": 3}])
+        self.assertEqual(f.getvalue(), b'{"a":1}\n{"c":3}\n')
+
+    def test_batch_failure(self):
+        """
+        If C{write_batch} raises an exception, the messages are dropped rather
+        than passed to the wrapped destination again, since they may already
+        have been written.
+        """
+        written = []
+
+        class Destination(object):
+            def __call__(self, message):
+                written.append(message)
+
+            def write_batch(self, messages):
+                written.extend(messages)
+                raise RuntimeError("flush failed")
+
+        writer = ThreadedWriter(Destination(), reactor)
+        writer._write([{"a": 1}, {"b": 2}])
+        self.assertEqual(written, [{"a": 1}, {"b": 2}])
@@ -12,11 +12,8 @@ from tempfile import mktemp
 from time import time
 from uuid import UUID
 from threading import Thread
+from importlib.util import find_spec
 
-try:
-    import numpy as np
-except ImportError:
-    np = None
 from zope.interface.verify import verifyClass
 
 from .._output import (
@@ -27,6 +24,7 @@ from .._output import (
     to_file,
     FileDestination,
     _safe_unicode_dictionary,
+    _safe_unicode_dictionary_as_dict,
 )
 from .._action import start_action
 from .._validation import ValidationError, Field, _MessageSerializer
@@ -34,17 +32,37 @@ from .._traceback import write_traceback
 from ..testing import assertContainsFields
 from .common import CustomObject, CustomJSONEncoder
 
+# NumPy is slow to import, so only import it in the tests that use it:
+has_numpy = find_spec("numpy") is not None
 
-class MemoryLoggerTests(TestCase):
+# Serializer shared by tests that don't care about the details of
+# serialization:
+LENGTH_SERIALIZER = _MessageSerializer(
+    [
+        Field.forValue("message_type", "mymessage", "The type"),
+        Field("length", len, "The length of a thing"),
+    ]
+)
+
+
+class InterfaceTests(TestCase):
     """
-    Tests for L{MemoryLogger}.
+    Tests for implementations of L{ILogger}.
     """
 
     def test_interface(self):
         """
-        L{MemoryLogger} implements L{ILogger}.
+        L{MemoryLogger} and L{Logger} implement L{ILogger}.
         """
-        verifyClass(ILogger, MemoryLogger)
+        for cls in [MemoryLogger, Logger]:
+            with self.subTest(cls=cls):
+                verifyClass(ILogger, cls)
+
+
+class MemoryLoggerTests(TestCase):
+    """
+    Tests for L{MemoryLogger}.
+    """
 
     def test_write(self):
         """
@@ -56,22 +74,53 @@ class MemoryLoggerTests(TestCase):
         self.assertEqual(logger.messages, [{"a": "b"}, {"c": 1}])
         logger.validate()
 
+    def test_write_many(self):
+        """
+        Dictionaries written with L{MemoryLogger.write_many} are stored on a
+        list, in order.
+        """
+        logger = MemoryLogger()
+        logger.write_many([{"a": "b"}, {"c": 1}])
+        self.assertEqual(logger.messages, [{"a": "b"}, {"c": 1}])
+        logger.validate()
+
+    def test_write_many_serializer(self):
+        """
+        L{MemoryLogger.write_many} calls the given serializer's C{validate()}
+        method with each message, as L{MemoryLogger.write} does.
+        """
+
+        class FakeValidator(list):
+            def validate(self, message):
+                self.append(message)
+
+            def serialize(self, obj):
+                return obj
+
+        validator = FakeValidator()
+        logger = MemoryLogger()
+        messages = [{"message_type": "mymessage", "X": 1}, {"message_type": "b"}]
+        logger.write_many(messages, validator)
+        self.assertEqual(validator, messages)
+        self.assertEqual(logger.serializers, [validator, validator])
+
     def test_notStringFieldKeys(self):
         """
-        Field keys must be unicode or bytes; if not L{MemoryLogger.validate}
-        raises a C{TypeError}.
+        Field keys must be unicode; if not L{MemoryLogger.validate} raises a
+        C{TypeError}.
         """
         logger = MemoryLogger()
         logger.write({123: "b"})
         self.assertRaises(TypeError, logger.validate)
 
-    def test_bytesMustBeUTF8(self):
+    def test_bytesFieldKeys(self):
         """
-        Field keys can be bytes, but only if they're UTF-8 encoded Unicode.
+        Field keys can't be bytes, even if they're UTF-8 encoded Unicode, since
+        they can't be encoded to JSON.
         """
         logger = MemoryLogger()
-        logger.write({"\u1234".encode("utf-16"): "b"})
-        self.assertRaises(UnicodeDecodeError, logger.validate)
+        logger.write({"\u1234".encode("utf-8"): "b"})
+        self.assertRaises(TypeError, logger.validate)
 
     def test_serializer(self):
         """
@@ -123,12 +172,14 @@ class MemoryLoggerTests(TestCase):
         )
         self.assertRaises(TypeError, logger.validate)
 
-    @skipUnless(np, "NumPy is not installed.")
+    @skipUnless(has_numpy, "NumPy is not installed.")
     def test_EliotJSONEncoder(self):
         """
         L{MemoryLogger.validate} uses the EliotJSONEncoder by default to do
         encoding testing.
         """
+        import numpy as np
+
         logger = MemoryLogger()
         logger.write({"message_type": "type", "foo": np.uint64(12)}, None)
         logger.validate()
@@ -149,19 +200,13 @@ class MemoryLoggerTests(TestCase):
         L{MemoryLogger.serialize} returns a list of serialized versions of the
         logged messages.
         """
-        serializer = _MessageSerializer(
-            [
-                Field.forValue("message_type", "mymessage", "The type"),
-                Field("length", len, "The length"),
-            ]
-        )
         messages = [
             {"message_type": "mymessage", "length": "abc"},
             {"message_type": "mymessage", "length": "abcd"},
         ]
         logger = MemoryLogger()
         for message in messages:
-            logger.write(message, serializer)
+            logger.write(message, LENGTH_SERIALIZER)
         self.assertEqual(
             logger.serialize(),
             [
@@ -174,15 +219,9 @@ class MemoryLoggerTests(TestCase):
         """
         L{MemoryLogger.serialize} does not mutate the original logged messages.
         """
-        serializer = _MessageSerializer(
-            [
-                Field.forValue("message_type", "mymessage", "The type"),
-                Field("length", len, "The length"),
-            ]
-        )
         message = {"message_type": "mymessage", "length": "abc"}
         logger = MemoryLogger()
-        logger.write(message, serializer)
+        logger.write(message, LENGTH_SERIALIZER)
         logger.serialize()
         self.assertEqual(logger.messages[0]["length"], "abc")
 
@@ -209,14 +248,28 @@ class MemoryLoggerTests(TestCase):
         """
         Any tracebacks cleared by L{MemoryLogger.flushTracebacks} (as specified
         by exception type) are removed from
-        L{MemoryLogger.tracebackMessages}.
+        L{MemoryLogger.tracebackMessages} and returned.
         """
         logger = MemoryLogger()
         exception = RuntimeError()
         self.write_traceback(logger, exception)
-        logger.flushTracebacks(RuntimeError)
+        flushed = logger.flushTracebacks(RuntimeError)
+        self.assertEqual([m["reason"] for m in flushed], [exception])
         self.assertEqual(logger.tracebackMessages, [])
 
+    def test_flushTracebacksUnflushed(self):
+        """
+        Any tracebacks uncleared by L{MemoryLogger.flushTracebacks} (because
+        they are of a different type) are not returned, and are still listed
+        in L{MemoryLogger.tracebackMessages}.
+        """
+        logger = MemoryLogger()
+        exception = RuntimeError()
+        self.write_traceback(logger, exception)
+        flushed = logger.flushTracebacks(KeyError)
+        self.assertEqual(flushed, [])
+        self.assertEqual([m["reason"] for m in logger.tracebackMessages], [exception])
+
     def test_flushTracebacksReturnsExceptions(self):
         """
         L{MemoryLogger.flushTracebacks} returns the traceback messages.
@@ -230,27 +283,24 @@ class MemoryLoggerTests(TestCase):
         flushed = logger.flushTracebacks(ZeroDivisionError)
         self.assertEqual(flushed, logger.messages[1:3])
 
-    def test_flushTracebacksUnflushedTestFailure(self):
+    def test_flushTracebacksSubset(self):
         """
-        Any tracebacks uncleared by L{MemoryLogger.flushTracebacks} (because
-        they are of a different type) are still listed in
-        L{MemoryLogger.tracebackMessages}.
+        L{MemoryLogger.flushTracebacks} only flushes tracebacks whose exception
+        is an instance of the given type, including subclasses, and leaves the
+        others in place in their original order.
         """
         logger = MemoryLogger()
-        exception = RuntimeError()
-        self.write_traceback(logger, exception)
-        logger.flushTracebacks(KeyError)
-        self.assertEqual(logger.tracebackMessages[0]["reason"], exception)
-
-    def test_flushTracebacksUnflushedUnreturned(self):
-        """
-        Any tracebacks uncleared by L{MemoryLogger.flushTracebacks} (because
-        they are of a different type) are not returned.
-        """
-        logger = MemoryLogger()
-        exception = RuntimeError()
-        self.write_traceback(logger, exception)
-        self.assertEqual(logger.flushTracebacks(KeyError), [])
+        exceptions = [KeyError(), RuntimeError(), IndexError(), ValueError()]
+        for exc in exceptions:
+            self.write_traceback(logger, exc)
+        flushed = logger.flushTracebacks(LookupError)
+        self.assertEqual([m["reason"] for m in flushed], [exceptions[0], exceptions[2]])
+        self.assertEqual(
+            [m["reason"] for m in logger.tracebackMessages],
+            [exceptions[1], exceptions[3]],
+        )
+        logger.flushTracebacks(Exception)
+        self.assertEqual(logger.tracebackMessages, [])
 
     def test_reset(self):
         """
@@ -264,6 +314,18 @@ class MemoryLoggerTests(TestCase):
             ([], [], []),
         )
 
+    def test_setAttribute(self):
+        """
+        Arbitrary attributes can be set on a L{MemoryLogger}, e.g. to
+        monkeypatch its methods in tests.
+        """
+        logger = MemoryLogger()
+        written = []
+        logger.write = lambda dictionary, serializer=None: written.append(dictionary)
+        logger.write({"key": "value"})
+        self.assertEqual(written, [{"key": "value"}])
+        self.assertEqual(logger.messages, [])
+
     def test_threadSafeWrite(self):
         """
         L{MemoryLogger.write} can be called from multiple threads concurrently.
@@ -336,18 +398,24 @@ class MyException(Exception):
     """
 
 
-class BadDestination(list):
+class BadDestination(object):
     """
     A destination that throws an exception the first time it is called.
+
+    @ivar messages: C{list} of messages received after the first call.
     """
 
-    called = 0
+    __slots__ = ("called", "messages")
+
+    def __init__(self):
+        self.called = False
+        self.messages = []
 
     def __call__(self, msg):
         if not self.called:
             self.called = True
             raise MyException("ono")
-        self.append(msg)
+        self.messages.append(msg)
 
 
 class DestinationsTests(TestCase):
@@ -372,10 +440,36 @@ class DestinationsTests(TestCase):
         self.assertEqual(dest2, [message])
         self.assertEqual(dest3, [message])
 
+    def test_send_many(self):
+        """
+        L{Destinations.send_many} calls destinations with a C{write_batch}
+        method once with all the messages, and other destinations once per
+        message.
+        """
+        destinations = Destinations()
+        messages = [{"hoorj": "blargh"}, {"hoorj": "blorgh"}]
+        batches = []
+
+        class BatchDestination(object):
+            def __call__(self, message):
+                raise AssertionError("Should have used write_batch().")
+
+            def write_batch(self, messages):
+                batches.append(list(messages))
+
+        dest = []
+        destinations.add(dest.append, BatchDestination())
+        destinations.addGlobalFields(x=1)
+        destinations.send_many(messages)
+        expected = [{"hoorj": "blargh", "x": 1}, {"hoorj": "blorgh", "x": 1}]
+        self.assertEqual(dest, expected)
+        self.assertEqual(batches, [expected])
+
     def test_destination_exception_multiple_destinations(self):
         """
         If one destination throws an exception, other destinations still
-        get the message.
+        get the message, and future messages are still sent to the failing
+        destination.
         """
         destinations = Destinations()
         dest = []
@@ -385,26 +479,29 @@ class DestinationsTests(TestCase):
         destinations.add(dest2)
         destinations.add(dest3.append)
 
-        message = {"hello": 123}
-        destinations.send(message)
-        self.assertIn(message, dest)
-        self.assertIn(message, dest3)
+        msg1 = {"hello": 123}
+        msg2 = {"world": 456}
+        destinations.send(msg1)
+        destinations.send(msg2)
+        self.assertEqual(
+            (dest, dest2.messages, dest3), ([msg1, msg2], [msg2], [msg1, msg2])
+        )
 
-    def test_destination_exception_continue(self):
+    def test_destination_exception_traceback_dropped(self):
         """
-        If a destination throws an exception, future messages are still
-        sent to it.
+        Exceptions raised by destinations don't keep their traceback, and
+        therefore the frames it references, alive after
+        L{Destinations.send} returns.
         """
+        exception = MyException("ono")
+
+        def dest(message):
+            raise exception
+
         destinations = Destinations()
-        dest = BadDestination()
         destinations.add(dest)
-
-        msg1 = {"hello": 123}
-        msg2 = {"world": 456}
-        destinations.send(msg1)
-        self.assertNotIn(msg1, dest)
-        destinations.send(msg2)
-        self.assertIn(msg2, dest)
+        destinations.send({"hello": 123})
+        self.assertIsNone(exception.__traceback__)
 
     def test_remove(self):
         """
@@ -509,11 +606,8 @@ class LoggerTests(TestCase):
     Tests for L{Logger}.
     """
 
-    def test_interface(self):
-        """
-        L{Logger} implements L{ILogger}.
-        """
-        verifyClass(ILogger, Logger)
+    def setUp(self):
+        self.logger, self.written = makeLogger()
 
     def test_global(self):
         """
@@ -525,43 +619,91 @@ class LoggerTests(TestCase):
         """
         L{Logger.write} sends the given dictionary L{Destinations} object.
         """
-        logger, written = makeLogger()
-
         d = {"hello": 1}
-        logger.write(d)
-        self.assertEqual(written, [d])
+        self.logger.write(d)
+        self.assertEqual(self.written, [d])
 
-    def test_serializer(self):
+    def test_write_many(self):
         """
-        If a L{_MessageSerializer} is passed to L{Logger.write}, it is used to
-        serialize the message before it is passed to the destination.
+        L{Logger.write_many} sends the given dictionaries to the
+        L{Destinations} object without modifying them.
         """
-        logger, written = makeLogger()
-
-        serializer = _MessageSerializer(
+        messages = [
+            {"message_type": "mymessage", "length": "abc"},
+            {"message_type": "mymessage", "length": "abcd"},
+        ]
+        self.logger.write_many(messages, LENGTH_SERIALIZER)
+        self.assertEqual(
+            self.written,
             [
-                Field.forValue("message_type", "mymessage", "The type"),
-                Field("length", len, "The length of a thing"),
-            ]
+                {"message_type": "mymessage", "length": 3},
+                {"message_type": "mymessage", "length": 4},
+            ],
+        )
+        self.assertEqual(
+            messages,
+            [
+                {"message_type": "mymessage", "length": "abc"},
+                {"message_type": "mymessage", "length": "abcd"},
+            ],
         )
-        logger.write({"message_type": "mymessage", "length": "thething"}, serializer)
-        self.assertEqual(written, [{"message_type": "mymessage", "length": 8}])
 
-    def test_passedInDictionaryUnmodified(self):
+    def test_write_many_serialization_failure(self):
         """
-        The dictionary passed in to L{Logger.write} is not modified.
+        If serialization of one of the messages passed to L{Logger.write_many}
+        fails, the failure is logged and the other messages are still
+        written, in the same order as they were given.
         """
-        logger, written = makeLogger()
+
+        def raiser(i):
+            if i == "fail":
+                raise RuntimeError("oops")
+            return i
 
         serializer = _MessageSerializer(
             [
                 Field.forValue("message_type", "mymessage", "The type"),
-                Field("length", len, "The length of a thing"),
+                Field("value", raiser, "Serialization might fail"),
             ]
         )
+        self.logger.write_many(
+            [
+                {"message_type": "mymessage", "value": "before"},
+                {"message_type": "mymessage", "value": "fail"},
+                {"message_type": "mymessage", "value": "after"},
+            ],
+            serializer,
+        )
+        self.assertEqual(
+            [
+                (message["message_type"], message.get("value"))
+                for message in self.written
+            ],
+            [
+                ("mymessage", "before"),
+                ("eliot:traceback", None),
+                ("eliot:serialization_failure", None),
+                ("mymessage", "after"),
+            ],
+        )
+
+    def test_serializer(self):
+        """
+        If a L{_MessageSerializer} is passed to L{Logger.write}, it is used to
+        serialize the message before it is passed to the destination.
+        """
+        self.logger.write(
+            {"message_type": "mymessage", "length": "thething"}, LENGTH_SERIALIZER
+        )
+        self.assertEqual(self.written, [{"message_type": "mymessage", "length": 8}])
+
+    def test_passedInDictionaryUnmodified(self):
+        """
+        The dictionary passed in to L{Logger.write} is not modified.
+        """
         d = {"message_type": "mymessage", "length": "thething"}
         original = d.copy()
-        logger.write(d, serializer)
+        self.logger.write(d, LENGTH_SERIALIZER)
         self.assertEqual(d, original)
 
     def test_safe_unicode_dictionary(self):
@@ -581,6 +723,24 @@ class LoggerTests(TestCase):
             {badMessage: "123", "123": badMessage},
         )
 
+    def test_safe_unicode_dictionary_as_dict(self):
+        """
+        L{_safe_unicode_dictionary_as_dict} returns a dictionary mapping the
+        C{repr()} of the given dictionary's keys to the C{repr()} of its
+        values.
+        """
+
+        class badobject(object):
+            def __repr__(self):
+                raise TypeError()
+
+        dictionary = {badobject(): 123, 123: badobject(), "a": "b"}
+        badMessage = "eliot: unknown, str() raised exception"
+        self.assertEqual(
+            _safe_unicode_dictionary_as_dict(dictionary),
+            {badMessage: "123", "123": badMessage, "'a'": "'b'"},
+        )
+
     def test_safe_unicode_dictionary_fallback(self):
         """
         If converting the dictionary failed for some reason,
@@ -608,7 +768,6 @@ class LoggerTests(TestCase):
         along with a C{eliot:serialization_failure} message for debugging
         purposes.
         """
-        logger, written = makeLogger()
 
         def raiser(i):
             raise RuntimeError("oops")
@@ -620,9 +779,9 @@ class LoggerTests(TestCase):
             ]
         )
         message = {"message_type": "mymessage", "fail": "will"}
-        logger.write(message, serializer)
-        self.assertEqual(len(written), 2)
-        tracebackMessage = written[0]
+        self.logger.write(message, serializer)
+        self.assertEqual(len(self.written), 2)
+        tracebackMessage = self.written[0]
         assertContainsFields(
             self,
             tracebackMessage,
@@ -632,14 +791,15 @@ class LoggerTests(TestCase):
             },
         )
         self.assertIn("RuntimeError: oops", tracebackMessage["traceback"])
-        # Calling _safe_unicode_dictionary multiple times leads to
-        # inconsistent results due to hash ordering, so compare contents:
         assertContainsFields(
-            self, written[1], {"message_type": "eliot:serialization_failure"}
-        )
-        self.assertEqual(
-            eval(written[1]["message"]),
-            dict((repr(key), repr(value)) for (key, value) in message.items()),
+            self,
+            self.written[1],
+            {
+                "message_type": "eliot:serialization_failure",
+                "message": dict(
+                    (repr(key), repr(value)) for (key, value) in message.items()
+                ),
+            },
         )
 
     def test_destination_exception_caught(self):
@@ -647,8 +807,7 @@ class LoggerTests(TestCase):
         If a destination throws an exception, an appropriate error is
         logged.
         """
-        logger = Logger()
-        logger._destinations = Destinations()
+        logger = self.logger
         dest = BadDestination()
         logger._destinations.add(dest)
 
@@ -656,10 +815,10 @@ class LoggerTests(TestCase):
         logger.write({"hello": 123})
         assertContainsFields(
             self,
-            dest[0],
+            dest.messages[0],
             {
                 "message_type": "eliot:destination_failure",
-                "message": _safe_unicode_dictionary(message),
+                "message": _safe_unicode_dictionary_as_dict(message),
                 "reason": "ono",
                 "exception": "eliot.tests.test_output.MyException",
             },
@@ -670,8 +829,7 @@ class LoggerTests(TestCase):
         If multiple destinations throw an exception, an appropriate error is
         logged for each.
         """
-        logger = Logger()
-        logger._destinations = Destinations()
+        logger = self.logger
         logger._destinations.add(BadDestination())
         logger._destinations.add(lambda msg: 1 / 0)
         messages = []
@@ -709,13 +867,13 @@ class LoggerTests(TestCase):
                     message,
                     {
                         "message_type": "eliot:destination_failure",
-                        "message": _safe_unicode_dictionary(message),
+                        "message": _safe_unicode_dictionary_as_dict(message),
                         "reason": "ono",
                         "exception": "eliot.tests.test_output.MyException",
                     },
                     {
                         "message_type": "eliot:destination_failure",
-                        "message": _safe_unicode_dictionary(message),
+                        "message": _safe_unicode_dictionary_as_dict(message),
                         "reason": zero_divide,
                         "exception": zero_type,
                     },
@@ -723,14 +881,145 @@ class LoggerTests(TestCase):
             ),
         )
 
+    def test_destination_multiple_exceptions_message_converted_once(self):
+        """
+        If multiple destinations throw an exception for the same message, the
+        message is only converted to its safe logged form once.
+        """
+        reprs = []
+
+        class Value(object):
+            def __repr__(self):
+                reprs.append(self)
+                return "<Value>"
+
+        logger = self.logger
+        logger._destinations.add(BadDestination())
+        logger._destinations.add(lambda msg: 1 / 0)
+        logger.write({"hello": Value()})
+        self.assertEqual(len(reprs), 1)
+        self.assertEqual(
+            [m["message"] for m in self.written[1:]],
+            [{"'hello'": "<Value>"}, {"'hello'": "<Value>"}],
+        )
+
+    def test_write_many_destination_exception_caught(self):
+        """
+        If a destination's C{write_batch} throws an exception, the messages
+        are not passed to the destination again, and after the batch an error
+        is logged for each of them.
+        """
+        logger = self.logger
+
+        class BadBatchDestination(list):
+            def __call__(self, message):
+                self.append(message)
+
+            def write_batch(self, messages):
+                raise MyException("ono")
+
+        dest = BadBatchDestination()
+        logger._destinations.add(dest)
+
+        logger.write_many([{"hello": 123}, {"hello": 456}])
+        self.assertEqual(
+            [(m["message_type"], m["reason"]) for m in dest],
+            [
+                ("eliot:destination_failure", "ono"),
+                ("eliot:destination_failure", "ono"),
+            ],
+        )
+        self.assertEqual(
+            [m["message"] for m in dest],
+            [
+                _safe_unicode_dictionary_as_dict({"hello": 123}),
+                _safe_unicode_dictionary_as_dict({"hello": 456}),
+            ],
+        )
+
+    def test_write_many_destination_failures_returned(self):
+        """
+        If a destination's C{write_batch} returns C{(message, exception)}
+        pairs, an error is logged after the batch for each of those messages.
+        """
+        logger = self.logger
+
+        class PartialBatchDestination(list):
+            def __call__(self, message):
+                self.append(message)
+
+            def write_batch(self, messages):
+                self.extend(m for m in messages if m.get("hello") != 456)
+                return [
+                    (m, MyException("ono")) for m in messages if m.get("hello") == 456
+                ]
+
+        dest = PartialBatchDestination()
+        logger._destinations.add(dest)
+
+        logger.write_many([{"hello": 123}, {"hello": 456}, {"hello": 789}])
+        self.assertEqual(
+            [(m.get("message_type"), m.get("hello"), m.get("reason")) for m in dest],
+            [
+                (None, 123, None),
+                (None, 789, None),
+                ("eliot:destination_failure", None, "ono"),
+            ],
+        )
+
+    def test_write_many_file_destination_flush_fails(self):
+        """
+        If flushing a L{FileDestination} fails while writing a batch, the
+        messages are not written a second time.
+        """
+
+        class BadFlush(BytesIO):
+            def flush(self):
+                raise IOError("disk full")
+
+        f = BadFlush()
+        self.logger._destinations.add(FileDestination(file=f))
+        self.logger.write_many([{"a": 1}, {"b": 2}])
+        self.assertEqual(
+            [m for m in _loads_lines(f) if "message_type" not in m],
+            [{"a": 1}, {"b": 2}],
+        )
+
+    def test_write_many_file_destination_bad_message(self):
+        """
+        If one message in a batch written to a L{FileDestination} can't be
+        encoded, the other messages are still written and an error is logged
+        only for the bad message.
+        """
+        f = BytesIO()
+        self.logger._destinations.add(FileDestination(file=f))
+        bad = object()
+        self.logger.write_many([{"a": 1}, {"b": bad}, {"c": 3}])
+        written = _loads_lines(f)
+        self.assertEqual(
+            [
+                (m.get("message_type"), m.get("message"))
+                for m in written
+                if "message_type" in m
+            ],
+            [
+                (
+                    "eliot:destination_failure",
+                    _safe_unicode_dictionary_as_dict({"b": bad}),
+                )
+            ],
+        )
+        self.assertEqual(
+            [m for m in written if "message_type" not in m], [{"a": 1}, {"c": 3}]
+        )
+
     def test_destination_exception_caught_twice(self):
         """
         If a destination throws an exception, and the logged error about
         it also causes an exception, then just drop that exception on the
         floor, since there's nothing we can do with it.
         """
-        logger = Logger()
-        logger._destinations = Destinations()
+        logger = self.logger
 
         def always_raise(message):
             raise ZeroDivisionError()
@@ -760,6 +1049,26 @@ class PEP8Tests(TestCase):
         self.assertEqual(MemoryLogger.flush_tracebacks, MemoryLogger.flushTracebacks)
 
 
+def _loads_lines(f):
+    """
+    Parse JSON lines, as written by L{FileDestination}, in a single call.
+
+    The lines are read one at a time, rather than copying the whole file
+    contents and then splitting them.
+
+    @param f: A binary or text file containing newline-separated JSON
+        messages.
+
+    @return: C{list} of decoded messages.
+    """
+    f.seek(0)
+    # Trailing newlines are valid JSON whitespace, so lines can be joined
+    # as-is:
+    if isinstance(f.read(0), bytes):
+        return pyjson.loads(b"[" + b",".join(f) + b"]")
+    return pyjson.loads("[" + ",".join(f) + "]")
+
+
 class ToFileTests(TestCase):
     """
     Tests for L{to_file}.
@@ -808,16 +1117,16 @@ class ToFileTests(TestCase):
         self.addCleanup(Logger._destinations.remove, added)
         self.assertEqual(added._json_default(object()), 23)
 
-    @skipUnless(np, "NumPy is not installed.")
+    @skipUnless(has_numpy, "NumPy is not installed.")
     def test_default_encoder_supports_numpy(self):
         """The default encoder can encode NumPy objects."""
+        import numpy as np
+
         message = {"x": np.int64(3)}
         f = StringIO()
         destination = FileDestination(file=f)
         destination(message)
-        self.assertEqual(
-            [pyjson.loads(line) for line in f.getvalue().splitlines()], [{"x": 3}]
-        )
+        self.assertEqual(_loads_lines(f), [{"x": 3}])
 
     def test_filedestination_writes_json_bytes(self):
         """
@@ -830,10 +1139,28 @@ class ToFileTests(TestCase):
         destination = FileDestination(file=bytes_f)
         destination(message1)
         destination(message2)
-        self.assertEqual(
-            [pyjson.loads(line) for line in bytes_f.getvalue().splitlines()],
-            [message1, message2],
-        )
+        self.assertEqual(_loads_lines(bytes_f), [message1, message2])
+
+    def test_filedestination_write_batch(self):
+        """
+        L{FileDestination.write_batch} writes all the given messages as JSON
+        lines with a single C{write()} call.
+        """
+        writes = []
+
+        class File(BytesIO):
+            def write(self, data):
+                writes.append(data)
+                return BytesIO.write(self, data)
+
+        message1 = {"x": 123}
+        message2 = {"y": None, "x": "abc"}
+        bytes_f = File()
+        destination = FileDestination(file=bytes_f)
+        destination.write_batch([message1, message2])
+        # The empty write is FileDestination checking the file is binary:
+        self.assertEqual(writes, [b"", bytes_f.getvalue()])
+        self.assertEqual(_loads_lines(bytes_f), [message1, message2])
 
     def test_filedestination_custom_encoder(self):
         """
@@ -891,13 +1218,7 @@ class ToFileTests(TestCase):
         destination(message1)
 
         # Message got written even though buffer wasn't filled:
-        self.assertEqual(
-            [
-                pyjson.loads(line.decode("utf-8"))
-                for line in open(path, "rb").read().splitlines()
-            ],
-            [message1],
-        )
+        self.assertEqual(_loads_lines(open(path, "rb")), [message1])
 
     def test_filedestination_writes_json_unicode(self):
         """
@@ -3,20 +3,19 @@ Tests for L{eliot._parse}.
 """
 
 from unittest import TestCase
-from itertools import chain, zip_longest
+from itertools import cycle, islice
 
 from hypothesis import strategies as st, given, assume
 
 from pyrsistent import PClass, field, pvector_field
 
-from .. import start_action, Message
+from .. import start_action, log_message, Message
 from ..testing import MemoryLogger
 from ..parse import Task, Parser
 from .._message import (
     WrittenMessage,
     MESSAGE_TYPE_FIELD,
     TASK_LEVEL_FIELD,
-    TASK_UUID_FIELD,
 )
 from .._action import FAILED_STATUS, ACTION_STATUS_FIELD, WrittenAction
 from .strategies import labels
@@ -61,26 +60,32 @@ class ActionStructure(PClass):
         """
         if isinstance(structure_or_message, cls):
             action = structure_or_message
-            try:
-                with start_action(logger, action_type=action.type):
-                    for child in action.children:
-                        cls.to_eliot(child, logger)
-                    if structure_or_message.failed:
-                        raise RuntimeError("Make the eliot action fail.")
-            except RuntimeError:
-                pass
+            eliot_action = start_action(logger, action_type=action.type)
+            with eliot_action.context():
+                for child in action.children:
+                    cls.to_eliot(child, logger)
+            # Finish explicitly, so failure doesn't require raising and
+            # catching an exception:
+            eliot_action.finish(
+                RuntimeError("Make the eliot action fail.") if action.failed else None
+            )
         else:
-            Message.new(message_type=structure_or_message).write(logger)
+            log_message(message_type=structure_or_message, __eliot_logger__=logger)
         return logger.messages
 
 
 @st.composite
-def action_structures(draw):
+def action_structures(draw, action_root=False):
     """
     A Hypothesis strategy that creates a tree of L{ActionStructure} and
     L{str}.
+
+    @param action_root: If true, the root of the tree is always an
+        L{ActionStructure} rather than a L{str}.
     """
     tree = draw(st.recursive(labels, st.lists, max_leaves=20))
+    if action_root and not isinstance(tree, list):
+        tree = [tree]
 
     def to_structure(tree_or_message):
         if isinstance(tree_or_message, list):
@@ -104,6 +109,26 @@ def _structure_and_messages(structure):
 # corresponding serialized Eliot messages, randomly shuffled.
 STRUCTURES_WITH_MESSAGES = action_structures().flatmap(_structure_and_messages)
 
+# Like STRUCTURES_WITH_MESSAGES, but the root is always an ActionStructure.
+ACTION_STRUCTURES_WITH_MESSAGES = action_structures(action_root=True).flatmap(
+    _structure_and_messages
+)
+
+
+@st.composite
+def _three_tasks_messages(draw):
+    """
+    Strategy that creates a tuple of three lists of serialized Eliot
+    messages, each list for a different task and randomly shuffled.
+
+    Each structure is logged as its own task, so task UUIDs are distinct
+    without having to filter examples.
+    """
+    return tuple(draw(STRUCTURES_WITH_MESSAGES)[1] for _ in range(3))
+
+
+THREE_TASKS_MESSAGES = _three_tasks_messages()
+
 
 def parse_to_task(messages):
     """
@@ -113,10 +138,38 @@ def parse_to_task(messages):
 
     @return: Resulting L{Task}.
     """
-    task = Task()
-    for message in messages:
-        task = task.add(message)
-    return task
+    return Task().add_many(messages)
+
+
+def _task_uuid(task):
+    """
+    @param task: A L{Task}.
+
+    @return: The task's UUID, for sorting L{Task} instances so lists of them
+        can be compared without the quadratic cost of C{assertCountEqual}.
+    """
+    return task.root().task_uuid
+
+
+def roundrobin(*iterables):
+    """
+    Interleave the items of several iterables, in the manner of the
+    C{itertools} documentation recipe.
+
+    @param iterables: Iterables whose items will be interleaved.
+
+    @return: Iterator of items, taking one from each iterable in turn until
+        all are exhausted.
+    """
+    iterators = cycle(iter(iterable).__next__ for iterable in iterables)
+    pending = len(iterables)
+    while pending:
+        try:
+            for next_item in iterators:
+                yield next_item()
+        except StopIteration:
+            pending -= 1
+            iterators = cycle(islice(iterators, pending))
 
 
 class TaskTests(TestCase):
@@ -124,7 +177,7 @@ class TaskTests(TestCase):
     Tests for L{Task}.
     """
 
-    @given(structure_and_messages=STRUCTURES_WITH_MESSAGES)
+    @given(structure_and_messages=ACTION_STRUCTURES_WITH_MESSAGES)
     def test_missing_action(self, structure_and_messages):
         """
         If we parse messages (in shuffled order) but a start message is
@@ -132,16 +185,17 @@ class TaskTests(TestCase):
         remaining messages.
         """
         action_structure, messages = structure_and_messages
-        assume(not isinstance(action_structure, str))
 
         # Remove first start message we encounter; since messages are
         # shuffled the location removed will differ over Hypothesis test
-        # iterations:
-        messages = messages[:]
-        for i, message in enumerate(messages):
-            if message[TASK_LEVEL_FIELD][-1] == 1:  # start message
-                del messages[i]
-                break
+        # iterations. st.permutations() draws a new list every time, so it
+        # can be modified in place:
+        i = next(
+            i
+            for i, message in enumerate(messages)
+            if message[TASK_LEVEL_FIELD][-1] == 1  # start message
+        )
+        del messages[i]
 
         task = parse_to_task(messages)
         parsed_structure = ActionStructure.from_written(task.root())
@@ -186,6 +240,20 @@ class TaskTests(TestCase):
 
         self.assertEqual(completed, [False for m in messages[:-1]] + [True])
 
+    @given(structure_and_messages=STRUCTURES_WITH_MESSAGES)
+    def test_add_many(self, structure_and_messages):
+        """
+        ``Task.add_many()`` results in the same L{Task} as calling
+        ``Task.add()`` for each message in turn.
+        """
+        action_structure, messages = structure_and_messages
+
+        task = Task()
+        for message in messages:
+            task = task.add(message)
+
+        self.assertEqual(Task().add_many(messages), task)
+
     def test_parse_contents(self):
         """
         L{{Task.add}} parses the contents of the messages it receives.
@@ -195,11 +263,8 @@ class TaskTests(TestCase):
             Message.new(message_type="zzz", z=4).write(logger)
             ctx.add_success_fields(foo=[1, 2])
         messages = logger.messages
-        expected = WrittenAction.from_messages(
-            WrittenMessage.from_dict(messages[0]),
-            [WrittenMessage.from_dict(messages[1])],
-            WrittenMessage.from_dict(messages[2]),
-        )
+        start, child, end = map(WrittenMessage.from_dict, messages)
+        expected = WrittenAction.from_messages(start, [child], end)
 
         task = parse_to_task(messages)
         self.assertEqual(task.root(), expected)
@@ -210,32 +275,21 @@ class ParserTests(TestCase):
     Tests for L{Parser}.
     """
 
-    @given(
-        structure_and_messages1=STRUCTURES_WITH_MESSAGES,
-        structure_and_messages2=STRUCTURES_WITH_MESSAGES,
-        structure_and_messages3=STRUCTURES_WITH_MESSAGES,
-    )
-    def test_parse_into_tasks(
-        self, structure_and_messages1, structure_and_messages2, structure_and_messages3
-    ):
+    @given(all_messages=THREE_TASKS_MESSAGES)
+    def test_parse_into_tasks(self, all_messages):
         """
         Adding messages to a L{Parser} parses them into a L{Task} instances.
         """
-        _, messages1 = structure_and_messages1
-        _, messages2 = structure_and_messages2
-        _, messages3 = structure_and_messages3
-        all_messages = (messages1, messages2, messages3)
-        # Need unique UUIDs per task:
-        assume(len(set(m[0][TASK_UUID_FIELD] for m in all_messages)) == 3)
-
         parser = Parser()
         all_tasks = []
-        for message in chain(*zip_longest(*all_messages)):
-            if message is not None:
-                completed_tasks, parser = parser.add(message)
-                all_tasks.extend(completed_tasks)
+        for message in roundrobin(*all_messages):
+            completed_tasks, parser = parser.add(message)
+            all_tasks.extend(completed_tasks)
 
-        self.assertCountEqual(all_tasks, [parse_to_task(msgs) for msgs in all_messages])
+        self.assertEqual(
+            sorted(all_tasks, key=_task_uuid),
+            sorted(map(parse_to_task, all_messages), key=_task_uuid),
+        )
 
     @given(structure_and_messages=STRUCTURES_WITH_MESSAGES)
     def test_incomplete_tasks(self, structure_and_messages):
@@ -262,38 +316,24 @@ class ParserTests(TestCase):
             dict(incomplete_matches=[True] * (len(messages) - 1), final_incompleted=[]),
         )
 
-    @given(
-        structure_and_messages1=STRUCTURES_WITH_MESSAGES,
-        structure_and_messages2=STRUCTURES_WITH_MESSAGES,
-        structure_and_messages3=STRUCTURES_WITH_MESSAGES,
-    )
-    def test_parse_stream(
-        self, structure_and_messages1, structure_and_messages2, structure_and_messages3
-    ):
+    @given(three_tasks_messages=THREE_TASKS_MESSAGES)
+    def test_parse_stream(self, three_tasks_messages):
         """
         L{Parser.parse_stream} returns an iterable of completed and then
         incompleted tasks.
         """
-        _, messages1 = structure_and_messages1
-        _, messages2 = structure_and_messages2
-        _, messages3 = structure_and_messages3
+        messages1, messages2, messages3 = three_tasks_messages
         # Need at least one non-dropped message in partial tree:
         assume(len(messages3) > 1)
-        # Need unique UUIDs per task:
-        assume(
-            len(set(m[0][TASK_UUID_FIELD] for m in (messages1, messages2, messages3)))
-            == 3
-        )
 
         # Two complete tasks, one incomplete task:
         all_messages = (messages1, messages2, messages3[:-1])
 
-        all_tasks = list(
-            Parser.parse_stream(
-                [m for m in chain(*zip_longest(*all_messages)) if m is not None]
-            )
+        all_tasks = list(Parser.parse_stream(roundrobin(*all_messages)))
+        self.assertEqual(
+            sorted(all_tasks, key=_task_uuid),
+            sorted(map(parse_to_task, all_messages), key=_task_uuid),
         )
-        self.assertCountEqual(all_tasks, [parse_to_task(msgs) for msgs in all_messages])
 
 
 class BackwardsCompatibility(TestCase):
@@ -5,12 +5,12 @@ Tests for C{eliot.prettyprint}.
 from unittest import TestCase
 from subprocess import check_output, Popen, PIPE
 from collections import OrderedDict
+from io import BytesIO, StringIO
 from datetime import datetime
-
-from pyrsistent import pmap
+from warnings import catch_warnings, simplefilter
 
 from ..json import _dumps_bytes as dumps
-from ..prettyprint import pretty_format, compact_format, REQUIRED_FIELDS
+from ..prettyprint import pretty_format, compact_format, REQUIRED_FIELDS, _main
 
 SIMPLE_MESSAGE = {
     "timestamp": 1443193754,
@@ -20,6 +20,9 @@ SIMPLE_MESSAGE = {
     "keys": [123, 456],
 }
 
+# SIMPLE_MESSAGE serialized as a line of JSON, without the newline:
+SIMPLE_MESSAGE_BYTES = dumps(SIMPLE_MESSAGE)
+
 UNTYPED_MESSAGE = {
     "timestamp": 1443193754,
     "task_uuid": "8c668cde-235b-4872-af4e-caea524bd1c0",
@@ -166,6 +169,34 @@ class FormattingTests(TestCase):
 """,
         )
 
+    def test_timestamp_rounding(self):
+        """
+        Timestamps are rendered the same way as L{datetime.isoformat}, with
+        microseconds rounded the same way as L{datetime.utcfromtimestamp}.
+        """
+        for timestamp in [
+            0,
+            1443193754,
+            1443193754.5,
+            1443193754.0000004,
+            1443193754.0000005,
+            1443193754.0000015,
+            1443193754.9999996,
+            1443193754.9999999,
+            -1.5,
+        ]:
+            with self.subTest(timestamp=timestamp):
+                message = {
+                    "timestamp": timestamp,
+                    "task_uuid": "8c668cde-235b-4872-af4e-caea524bd1c0",
+                    "task_level": [1],
+                }
+                with catch_warnings():
+                    # utcfromtimestamp() is deprecated on newer Pythons:
+                    simplefilter("ignore", DeprecationWarning)
+                    expected = datetime.utcfromtimestamp(timestamp).isoformat(sep="T")
+                self.assertEqual(pretty_format(message).splitlines()[1], expected + "Z")
+
     def test_compact(self):
         """
         The compact mode does everything on a single line, including
@@ -211,20 +242,25 @@ class CommandLineTests(TestCase):
 
     def write_and_read(self, lines, extra_args=()):
         """
-        Write the given lines to the command-line on stdin, return stdout.
+        Run the command-line program in-process with the given lines on
+        stdin, return stdout.
 
         @param lines: Sequences of lines to write, as bytes, and lacking
             new lines.
-        @return: Unicode-decoded result of subprocess stdout.
+        @return: Unicode result written to stdout.
         """
-        process = Popen(
-            [b"eliot-prettyprint"] + list(extra_args), stdin=PIPE, stdout=PIPE
-        )
-        process.stdin.write(b"".join(line + b"\n" for line in lines))
-        process.stdin.close()
-        result = process.stdout.read().decode("utf-8")
-        process.stdout.close()
-        return result
+        stdout = StringIO()
+        _main(list(extra_args), BytesIO(b"\n".join(lines) + b"\n"), stdout)
+        return stdout.getvalue()
+
+    def test_process(self):
+        """
+        The C{eliot-prettyprint} process reads JSON lines from stdin and
+        writes out a pretty-printed version.
+        """
+        process = Popen([b"eliot-prettyprint"], stdin=PIPE, stdout=PIPE)
+        stdout, _ = process.communicate(SIMPLE_MESSAGE_BYTES + b"\n")
+        self.assertEqual(stdout.decode("utf-8"), pretty_format(SIMPLE_MESSAGE) + "\n")
 
     def test_output(self):
         """
@@ -243,7 +279,7 @@ class CommandLineTests(TestCase):
         a pretty-printed compact version.
         """
         messages = [SIMPLE_MESSAGE, UNTYPED_MESSAGE, SIMPLE_MESSAGE]
-        stdout = self.write_and_read(map(dumps, messages), [b"--compact"])
+        stdout = self.write_and_read(map(dumps, messages), ["--compact"])
         self.assertEqual(
             stdout, "".join(compact_format(message) + "\n" for message in messages)
         )
@@ -259,20 +295,31 @@ class CommandLineTests(TestCase):
         }
         expected = datetime.fromtimestamp(1443193754).isoformat(sep="T")
         stdout = self.write_and_read(
-            [dumps(message)], [b"--compact", b"--local-timezone"]
+            [dumps(message)], ["--compact", "--local-timezone"]
         )
         self.assertIn(expected, stdout)
         stdout = self.write_and_read(
-            [dumps(message)], [b"--compact", b"--local-timezone"]
+            [dumps(message)], ["--compact", "--local-timezone"]
         )
         self.assertIn(expected, stdout)
 
+    def test_big_integer(self):
+        """
+        Integers too big for 64 bits are printed exactly.
+        """
+        message = dict(SIMPLE_MESSAGE, id=123456789012345678901234567890)
+        # orjson can't encode such integers, so add the field by hand:
+        line = b'{"id": 123456789012345678901234567890, ' + SIMPLE_MESSAGE_BYTES[1:]
+        stdout = self.write_and_read([line])
+        self.assertEqual(stdout, pretty_format(message) + "\n")
+        self.assertIn("123456789012345678901234567890", stdout)
+
     def test_not_json_message(self):
         """
         Non-JSON lines are not formatted.
         """
         not_json = b"NOT JSON!!"
-        lines = [dumps(SIMPLE_MESSAGE), not_json, dumps(UNTYPED_MESSAGE)]
+        lines = [SIMPLE_MESSAGE_BYTES, not_json, dumps(UNTYPED_MESSAGE)]
         stdout = self.write_and_read(lines)
         self.assertEqual(
             stdout,
@@ -287,10 +334,13 @@ class CommandLineTests(TestCase):
         """
         Non-Eliot JSON messages are not formatted.
         """
-        base = pmap(SIMPLE_MESSAGE)
-        messages = [dumps(dict(base.remove(field))) for field in REQUIRED_FIELDS] + [
-            dumps(SIMPLE_MESSAGE)
-        ]
+        message = dict(SIMPLE_MESSAGE)
+        messages = []
+        for field in REQUIRED_FIELDS:
+            value = message.pop(field)
+            messages.append(dumps(message))
+            message[field] = value
+        messages.append(SIMPLE_MESSAGE_BYTES)
         stdout = self.write_and_read(messages)
         self.assertEqual(
             stdout,
@@ -7,6 +7,9 @@ import time
 import subprocess
 from unittest import TestCase, SkipTest
 
+from hypothesis import given
+from hypothesis.strategies import floats
+
 from ..tai64n import encode, decode
 
 
@@ -29,6 +32,14 @@ class CodecTests(TestCase):
         t = time.time()
         self.assertAlmostEqual(t, decode(encode(t)), 9)
 
+    @given(floats(min_value=0, max_value=2**32))
+    def test_roundtrip(self, t):
+        """
+        L{decode} reverses L{encode} across the range of timestamps, to within
+        a few nanoseconds.
+        """
+        self.assertAlmostEqual(t, decode(encode(t)), delta=1e-8)
+
 
 class FunctionalTests(TestCase):
     """
@@ -397,6 +397,26 @@ class MessageSerializerTests(TestCase):
             message, {"message_type": "mymessage", "length": 8, "extra": 123}
         )
 
+    def test_serializeFieldSubclass(self):
+        """
+        L{_MessageSerializer.serialize} uses the C{serialize} method of
+        L{Field} subclasses that override it.
+        """
+
+        class UpperField(Field):
+            def serialize(self, input):
+                return Field.serialize(self, input).upper()
+
+        serializer = _MessageSerializer(
+            [
+                Field.forValue("message_type", "mymessage", "The type"),
+                UpperField("name", str, "A name"),
+            ]
+        )
+        message = {"message_type": "mymessage", "name": "alice"}
+        serializer.serialize(message)
+        self.assertEqual(message, {"message_type": "mymessage", "name": "ALICE"})
+
     def test_fieldInstances(self):
         """
         Fields to L{_MessageSerializer.__init__} should be instances of